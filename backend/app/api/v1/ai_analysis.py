@@ -7,6 +7,8 @@ from sqlalchemy.orm import Session
 from app.core.database import get_db
 from app.models import Opinion, OpinionCluster, CitationTreatment, Parenthetical
 from app.services.ai_risk_analyzer import get_ai_analyzer
+from app.services.opinion_body_store import get_stored_text
+from app.services.treatment_classifier import KEYWORD_VOCAB
 
 router = APIRouter()
 
@@ -48,8 +50,10 @@ async def analyze_opinion_risk(
     if not opinion:
         raise HTTPException(status_code=404, detail="Opinion not found")
 
-    # Get opinion text
-    opinion_text = opinion.plain_text or opinion.html
+    # Get opinion text; bodies written by fetch_all_opinions.py
+    # --body-store live in the on-disk zstd store keyed by sha1
+    opinion_text = opinion.plain_text or opinion.html \
+        or get_stored_text(opinion.sha1)
     if not opinion_text:
         raise HTTPException(
             status_code=400,
@@ -97,7 +101,22 @@ async def analyze_opinion_risk(
 
     # Build citing cases list from evidence if available
     if risk_summary.evidence and isinstance(risk_summary.evidence, dict):
-        negative_examples = risk_summary.evidence.get('negative_examples', [])
+        evidence = risk_summary.evidence
+        if 'neg' in evidence:
+            # Compact format from the bulk analyzer: each entry is
+            # [describing_opinion_id, score, [keyword_id, ...]] with
+            # keyword IDs indexing KEYWORD_VOCAB; the parenthetical
+            # text stays in search_parenthetical and is resolved below
+            negative_examples = [
+                {
+                    'describing_opinion_id': did,
+                    'keywords': [KEYWORD_VOCAB[k] for k in kids
+                                 if 0 <= k < len(KEYWORD_VOCAB)],
+                }
+                for did, _score, kids in evidence.get('neg', [])
+            ]
+        else:
+            negative_examples = evidence.get('negative_examples', [])
         for example in negative_examples[:5]:
             citing_opinion_id = example.get('describing_opinion_id')
             if citing_opinion_id:
@@ -109,10 +128,17 @@ async def analyze_opinion_risk(
                         OpinionCluster.id == citing_opinion.cluster_id
                     ).first()
                     if citing_cluster:
+                        excerpt = example.get('text')
+                        if excerpt is None:
+                            parenthetical = db.query(Parenthetical).filter(
+                                Parenthetical.described_opinion_id == opinion_id,
+                                Parenthetical.describing_opinion_id == citing_opinion_id
+                            ).first()
+                            excerpt = parenthetical.text if parenthetical else ''
                         citing_cases.append({
                             'case_name': citing_cluster.case_name,
                             'date_filed': citing_cluster.date_filed.isoformat() if citing_cluster.date_filed else None,
-                            'excerpt': example.get('text', ''),
+                            'excerpt': excerpt,
                             'keywords': example.get('keywords', [])
                         })
 
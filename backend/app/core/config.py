@@ -28,6 +28,10 @@ class Settings(BaseSettings):
     # Environment
     ENVIRONMENT: str = "development"
     
+    # Opinion body store written by scripts/fetch_all_opinions.py
+    # --body-store; empty = bodies live in the text columns as before
+    OPINION_BODY_STORE_DIR: str = ""
+
     # Import settings
     CSV_DATA_DIR: str = ".."  # CSV files are in project root
     IMPORT_BATCH_SIZE: int = 10000
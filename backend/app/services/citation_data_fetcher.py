@@ -16,6 +16,7 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from app.models import Opinion, OpinionCluster, Docket, Court, OpinionsCited
+from app.services.opinion_body_store import get_stored_text
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -280,6 +281,13 @@ def ensure_opinion_text(opinion: Opinion, db: Session) -> Optional[str]:
         logger.debug(f"Opinion {opinion.id} has html_with_citations ({len(opinion.html_with_citations)} chars)")
         return opinion.html_with_citations
 
+    # The body may live in the on-disk zstd store (fetch_all_opinions.py
+    # --body-store) with only the sha1 pointer in the row
+    stored = get_stored_text(opinion.sha1)
+    if stored:
+        logger.debug(f"Opinion {opinion.id} has stored body ({len(stored)} chars)")
+        return stored
+
     # No text in DB, fetch from API
     logger.info(f"Opinion {opinion.id} missing text, fetching from API")
 
@@ -0,0 +1,69 @@
+"""
+Read path for the on-disk opinion body store.
+
+scripts/fetch_all_opinions.py --body-store writes opinion HTML to
+zstd-compressed files keyed by sha1 (sharded by the first two hex chars)
+instead of Postgres TOAST; the search_opinion row keeps only the sha1
+pointer. Each blob is a JSON object with 'html' and 'html_with_citations'
+keys. This module resolves those bodies for the API when the text
+columns are NULL.
+
+The store directory comes from OPINION_BODY_STORE_DIR; when unset (the
+default) every lookup returns None and callers fall through to their
+existing behavior.
+"""
+import json
+import logging
+from pathlib import Path
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Optional fast compression (pip install zstandard)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+_decompressor = None
+
+
+def get_stored_body(sha1: Optional[str]) -> Optional[dict]:
+    """
+    Read an opinion body from the store by sha1.
+
+    Returns the decoded {'html': ..., 'html_with_citations': ...} dict,
+    or None when the store is not configured, the blob is absent, or
+    zstandard is not installed.
+    """
+    global _decompressor
+
+    if not sha1 or not settings.OPINION_BODY_STORE_DIR:
+        return None
+    if zstandard is None:
+        logger.warning("OPINION_BODY_STORE_DIR set but zstandard is not installed")
+        return None
+
+    path = Path(settings.OPINION_BODY_STORE_DIR) / sha1[:2] / f"{sha1}.zst"
+    try:
+        compressed = path.read_bytes()
+    except FileNotFoundError:
+        return None
+
+    if _decompressor is None:
+        _decompressor = zstandard.ZstdDecompressor()
+    try:
+        return json.loads(_decompressor.decompress(compressed))
+    except (zstandard.ZstdError, ValueError) as e:
+        logger.error(f"Corrupt body store entry for sha1 {sha1}: {e}")
+        return None
+
+
+def get_stored_text(sha1: Optional[str]) -> Optional[str]:
+    """Best available HTML from the store, or None"""
+    body = get_stored_body(sha1)
+    if not body:
+        return None
+    return body.get('html') or body.get('html_with_citations')
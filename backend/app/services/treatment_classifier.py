@@ -74,6 +74,12 @@ NEUTRAL_KEYWORDS = {
     'referencing': 1,
 }
 
+# Stable keyword vocabulary shared with the bulk analyzer script -
+# compact evidence rows store small integer IDs indexing this list
+# (evidence['keyword_vocab'] records the version; 0 = this ordering)
+KEYWORD_VOCAB = (list(NEGATIVE_KEYWORDS) + list(POSITIVE_KEYWORDS)
+                 + list(NEUTRAL_KEYWORDS))
+
 # Negation patterns that reverse positive keywords into negative
 # Format: (pattern, keyword_to_negate, negative_score)
 NEGATION_PATTERNS = [
@@ -3,84 +3,415 @@ Import script to run on Railway with bulk CSV data
 Usage: railway run python backend/scripts/import_railway.py --courts courts.csv --limit 10000
 """
 import csv
+import io
+import mmap
 import os
+import queue
+import struct
 import sys
+import threading
 import logging
 from pathlib import Path
 import psycopg2
-from psycopg2.extras import execute_batch
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-def parse_value(value, field_name=None):
-    """Parse CSV value"""
-    if not value or value == '\\N' or value == 'NULL':
+# Case variants enumerated so the hot path never allocates value.lower()
+_TRUE_VALUES = frozenset(('true', 'True', 'TRUE', 't', 'T', '1'))
+
+# `not value` screens '' and None first, so the frozenset probe - one
+# hash instead of chained string compares - only runs on real cells
+_NULLS = frozenset(('\\N', 'NULL'))
+
+def _parse_str(value):
+    if not value or value in _NULLS:
         return None
-    if field_name in ['date_filed_is_approximate', 'blocked']:
-        return 't' if value.lower() in ['true', 't', '1'] else 'f'
-    if field_name in ['id', 'docket_id', 'citation_count', 'source', 'depth',
-                      'cited_opinion_id', 'citing_opinion_id']:
-        try:
-            return str(int(value))
-        except:
-            return None
     return value
 
-def import_courts(conn, csv_path, batch_size=1000):
+def _parse_bool(value):
+    if not value or value in _NULLS:
+        return None
+    return 't' if value in _TRUE_VALUES else 'f'
+
+def _parse_int(value):
+    if not value or value in _NULLS:
+        return None
+    # Canonical ints pass through untouched; dump-style '123.0' drops the
+    # fractional part. No float round trip, no exception machinery, and
+    # unlike the old bare except nothing else gets silently swallowed.
+    if value.isdigit() or (value[0] == '-' and value[1:].isdigit()):
+        return value
+    dot = value.find('.')
+    if dot > 0:
+        head = value[:dot]
+        if head.isdigit() or (head[0] == '-' and head[1:].isdigit()):
+            return head
+    return None
+
+def _copy_escape(value):
+    """Encode one field for COPY text format (tab separators, \\N for NULL)"""
+    if value is None:
+        return '\\N'
+    return (value.replace('\\', '\\\\').replace('\t', '\\t')
+                 .replace('\n', '\\n').replace('\r', '\\r'))
+
+class _RowFile:
+    """
+    File-like over an iterable of row tuples, formatted for COPY.
+
+    copy_expert pulls through read(size), so rows are escaped lazily as
+    the socket drains instead of being materialized in one big buffer.
+    """
+
+    def __init__(self, rows):
+        self._lines = ('\t'.join(_copy_escape(v) for v in row) + '\n'
+                       for row in rows)
+        self._leftover = ''
+
+    def read(self, size=-1):
+        chunks = [self._leftover]
+        total = len(self._leftover)
+        self._leftover = ''
+        for line in self._lines:
+            chunks.append(line)
+            total += len(line)
+            if size >= 0 and total >= size:
+                break
+        data = ''.join(chunks)
+        if size >= 0 and len(data) > size:
+            self._leftover = data[size:]
+            data = data[:size]
+        return data
+
+def copy_rows(cursor, table, columns, rows, key='id'):
+    """
+    Stream rows through COPY into a temp staging table, then merge into
+    the target with ON CONFLICT DO NOTHING.
+
+    COPY ships a whole batch in one protocol message where execute_batch
+    still pays an INSERT parse/plan/execute per page; the staging hop
+    keeps the upsert semantics the INSERTs had. Temp tables are already
+    WAL-free (same win an UNLOGGED staging table would buy) and private
+    to each session, which is what lets CopyPool workers share nothing.
+    The DISTINCT ON trims intra-batch duplicate keys before the merge so
+    they never reach the target's speculative-insert machinery.
+    """
+    staging = f"stg_{table}"
+    col_list = ', '.join(columns)
+    # Clone just the loaded columns' types - no constraints or indexes
+    cursor.execute(f"""
+        CREATE TEMP TABLE IF NOT EXISTS {staging} AS
+        SELECT {col_list} FROM {table} LIMIT 0
+    """)
+    cursor.execute(f"TRUNCATE {staging}")
+    cursor.copy_expert(f"COPY {staging} ({col_list}) FROM STDIN",
+                       _RowFile(rows))
+    cursor.execute(f"""
+        INSERT INTO {table} ({col_list})
+        SELECT DISTINCT ON ({key}) {col_list} FROM {staging}
+        ON CONFLICT DO NOTHING
+    """)
+
+COURT_COLUMNS = ('id', 'full_name', 'short_name', 'citation_string', 'in_use',
+                 'has_opinion_scraper', 'has_oral_argument_scraper', 'position')
+DOCKET_COLUMNS = ('id', 'date_created', 'date_modified', 'source', 'court_id',
+                  'date_filed', 'case_name_short', 'case_name', 'case_name_full',
+                  'slug', 'docket_number')
+CLUSTER_COLUMNS = ('id', 'docket_id', 'date_created', 'date_modified', 'judges',
+                   'date_filed', 'date_filed_is_approximate', 'slug',
+                   'case_name_short', 'case_name', 'case_name_full', 'source',
+                   'procedural_history', 'attorneys', 'nature_of_suit', 'posture',
+                   'syllabus', 'summary', 'disposition', 'citation_count',
+                   'precedential_status', 'blocked')
+CITATION_COLUMNS = ('cited_opinion_id', 'citing_opinion_id', 'depth')
+
+# (csv column, default when missing/empty, parser) per loaded column, in
+# table order. Typing each column once here means the row loop dispatches
+# straight to the right parser with no per-field name comparisons. Court
+# ids are strings ('scotus'), so they take _parse_str - the old
+# parse_value routed every 'id' through int() and nulled them out.
+COURT_FIELDS = (('id', '', _parse_str), ('full_name', '', _parse_str),
+                ('short_name', '', _parse_str),
+                ('citation_string', '', _parse_str),
+                ('in_use', 't', _parse_bool),
+                ('has_opinion_scraper', 'f', _parse_bool),
+                ('has_oral_argument_scraper', 'f', _parse_bool),
+                ('position', '0', _parse_str))
+DOCKET_FIELDS = (('id', '', _parse_int), ('date_created', None, _parse_str),
+                 ('date_modified', None, _parse_str),
+                 ('source', '0', _parse_int), ('court_id', '', _parse_str),
+                 ('date_filed', None, _parse_str),
+                 ('case_name_short', None, _parse_str),
+                 ('case_name', None, _parse_str),
+                 ('case_name_full', None, _parse_str),
+                 ('slug', None, _parse_str), ('docket_number', None, _parse_str))
+CLUSTER_FIELDS = (('id', '', _parse_int), ('docket_id', '', _parse_int),
+                  ('date_created', None, _parse_str),
+                  ('date_modified', None, _parse_str),
+                  ('judges', None, _parse_str), ('date_filed', None, _parse_str),
+                  ('date_filed_is_approximate', 'f', _parse_bool),
+                  ('slug', None, _parse_str),
+                  ('case_name_short', None, _parse_str),
+                  ('case_name', None, _parse_str),
+                  ('case_name_full', None, _parse_str),
+                  ('source', '0', _parse_int),
+                  ('procedural_history', None, _parse_str),
+                  ('attorneys', None, _parse_str),
+                  ('nature_of_suit', None, _parse_str),
+                  ('posture', None, _parse_str), ('syllabus', None, _parse_str),
+                  ('summary', None, _parse_str),
+                  ('disposition', None, _parse_str),
+                  ('citation_count', '0', _parse_int),
+                  ('precedential_status', 'Unknown', _parse_str),
+                  ('blocked', 'f', _parse_bool))
+
+def tune_session(conn):
+    """
+    Set bulk-load session parameters once per loader connection.
+
+    synchronous_commit off stops commits waiting on the WAL flush,
+    work_mem covers the staging-merge sorts, and maintenance_work_mem
+    feeds index rebuilds. Session-level SETs here replace scattering
+    the same statements through every importer.
+    """
+    with conn.cursor() as cur:
+        cur.execute("SET synchronous_commit = off")
+        cur.execute("SET work_mem = '256MB'")
+        cur.execute("SET maintenance_work_mem = '1GB'")
+    conn.commit()
+
+# Tables the --bulk-load index phase covers, in import order
+BULK_TABLES = ('search_court', 'search_docket', 'search_opinioncluster',
+               'search_opinionscited')
+
+# Set by --bulk-load: worker sessions skip FK-validation triggers too
+BULK_LOAD = False
+
+def drop_indexes(db_url, tables):
+    """
+    Drop secondary indexes on the given tables, returning their DDL.
+
+    Maintaining a B-tree per insert costs O(log N) per row per index;
+    one bulk sort at rebuild time is far cheaper. Primary keys and
+    UNIQUE indexes stay - the bare ON CONFLICT DO NOTHING merges rely
+    on them to reject duplicates (citations have no usable pkey
+    arbiter, only the unique pair index), so dropping one would let a
+    re-run insert dupes and break the rebuild.
+    """
+    conn = psycopg2.connect(db_url)
+    conn.autocommit = True
+    cursor = conn.cursor()
+    dropped = []
+    for table in tables:
+        cursor.execute("""
+            SELECT indexname, indexdef FROM pg_indexes
+            WHERE schemaname = 'public' AND tablename = %s
+        """, (table,))
+        for name, ddl in cursor.fetchall():
+            if name.endswith('_pkey') or 'UNIQUE' in ddl:
+                continue
+            logger.info(f"Dropping index {name}")
+            cursor.execute(f"DROP INDEX {name}")
+            dropped.append(ddl)
+    conn.close()
+    return dropped
+
+def recreate_indexes(db_url, index_ddl):
+    """Rebuild dropped indexes without blocking readers"""
+    conn = psycopg2.connect(db_url)
+    conn.autocommit = True  # CONCURRENTLY cannot run inside a transaction
+    cursor = conn.cursor()
+    cursor.execute("SET maintenance_work_mem = '1GB'")
+    for ddl in index_ddl:
+        ddl = ddl.replace('CREATE INDEX', 'CREATE INDEX CONCURRENTLY', 1) \
+                 .replace('CREATE UNIQUE INDEX', 'CREATE UNIQUE INDEX CONCURRENTLY', 1)
+        logger.info(f"Rebuilding: {ddl[:80]}...")
+        cursor.execute(ddl)
+    conn.close()
+
+class CopyPool:
+    """
+    Writer threads draining parsed batches onto their own connections.
+
+    The parse loop keeps tokenizing the next batch while a worker's COPY,
+    merge and commit are still in flight; the bounded queue caps how far
+    parsing can run ahead when the database falls behind. Each worker
+    COPYs into its own temp staging table, so the only shared work is
+    the merge's ON CONFLICT arbitration. psycopg2 releases the GIL while
+    COPY blocks on the socket, so plain threads overlap fine.
+    """
+
+    def __init__(self, db_url, table, columns, workers=2):
+        self.table = table
+        self.columns = columns
+        self.queue = queue.Queue(maxsize=4)
+        self.errors = []
+        self.threads = []
+        for _ in range(workers):
+            t = threading.Thread(target=self._run, args=(db_url,), daemon=True)
+            t.start()
+            self.threads.append(t)
+
+    def _run(self, db_url):
+        conn = psycopg2.connect(db_url)
+        tune_session(conn)
+        cursor = conn.cursor()
+        if BULK_LOAD:
+            cursor.execute("SET session_replication_role = replica")
+        try:
+            while True:
+                batch = self.queue.get()
+                if batch is None:
+                    break
+                try:
+                    copy_rows(cursor, self.table, self.columns, batch)
+                    conn.commit()
+                except Exception as e:
+                    conn.rollback()
+                    self.errors.append(e)
+        finally:
+            cursor.close()
+            conn.close()
+
+    def submit(self, batch):
+        if self.errors:
+            raise self.errors[0]
+        self.queue.put(batch)
+
+    def close(self):
+        for _ in self.threads:
+            self.queue.put(None)
+        for t in self.threads:
+            t.join()
+        if self.errors:
+            raise self.errors[0]
+
+# Target ~8 MiB of serialized payload per COPY batch so round-trip and
+# merge costs amortize the same for a 22-column cluster row as for a
+# 3-column citation. COPY has no parameter-count ceiling, so this is
+# purely a memory/latency trade.
+_BATCH_TARGET_BYTES = 8 << 20
+_EST_FIELD_BYTES = 64
+
+def default_batch_size(columns):
+    """Rows per batch scaled inversely to the table's column count"""
+    return max(1000, _BATCH_TARGET_BYTES // (_EST_FIELD_BYTES * len(columns)))
+
+def _open_csv(csv_path):
+    """
+    Open a dump for sequential scanning with kernel readahead hints.
+
+    Binary open with a 1 MiB buffer turns the stream into few large
+    reads, and POSIX_FADV_SEQUENTIAL tells the kernel to read ahead
+    aggressively and drop pages behind us - these dumps are far bigger
+    than the page cache and are read exactly once.
+    """
+    f = open(csv_path, 'rb', buffering=1 << 20)
+    if hasattr(os, 'posix_fadvise'):
+        os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    return io.TextIOWrapper(f, encoding='utf-8', errors='replace', newline='')
+
+def _bind_fields(reader, fields):
+    """
+    Read the header and resolve a FIELDS spec to (position, default, parser).
+
+    csv.reader hands back plain lists, so binding names to positions once
+    up front drops the per-row dict construction and row.get() hashing
+    that DictReader charged for every field. Columns missing from the
+    file bind to index n_slots - 1; rows padded to n_slots therefore
+    always have an empty cell there, so the loop body can index every
+    row unconditionally and let `or default` fill the gaps. Returns the
+    bound columns, the header index for ad-hoc probes, and n_slots.
+    """
+    header = next(reader, None) or ()
+    idx = {name: j for j, name in enumerate(header)}
+    n_slots = len(header) + 1
+    missing = n_slots - 1
+    cols = [(idx.get(name, missing), default, fn) for name, default, fn in fields]
+    return cols, idx, n_slots
+
+# Binary COPY framing: signature + flags + header-extension length, and the
+# end-of-data trailer. Each citation row is a fixed 26-byte record: int16
+# field count, then (int32 length, int32 value) for the three int4 columns.
+_BINCOPY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+_BINCOPY_TRAILER = struct.pack('>h', -1)
+_pack_citation = struct.Struct('>hiiiiii').pack
+
+def copy_citation_rows(cursor, rows):
+    """
+    COPY (cited, citing, depth) int tuples in binary format and merge.
+
+    Binary COPY skips the client-side str() formatting and the server-side
+    text-to-int reparse that text COPY pays on every field. Citations are
+    the one all-integer table, so every field packs as a fixed int4; the
+    mixed tables keep text COPY since their dates and strings would need
+    per-type binary encodings that reintroduce the conversion cost.
+    """
+    parts = [_BINCOPY_HEADER]
+    for cited, citing, depth in rows:
+        parts.append(_pack_citation(3, 4, cited, 4, citing, 4, depth))
+    parts.append(_BINCOPY_TRAILER)
+    cursor.execute("""
+        CREATE TEMP TABLE IF NOT EXISTS stg_search_opinionscited AS
+        SELECT cited_opinion_id, citing_opinion_id, depth
+        FROM search_opinionscited LIMIT 0
+    """)
+    cursor.execute("TRUNCATE stg_search_opinionscited")
+    cursor.copy_expert(
+        "COPY stg_search_opinionscited (cited_opinion_id, citing_opinion_id, depth) "
+        "FROM STDIN WITH (FORMAT BINARY)",
+        io.BytesIO(b''.join(parts)))
+    cursor.execute("""
+        INSERT INTO search_opinionscited (cited_opinion_id, citing_opinion_id, depth)
+        SELECT DISTINCT ON (cited_opinion_id, citing_opinion_id)
+               cited_opinion_id, citing_opinion_id, depth
+        FROM stg_search_opinionscited
+        ON CONFLICT DO NOTHING
+    """)
+
+def import_courts(conn, csv_path, batch_size=None):
+    batch_size = batch_size or default_batch_size(COURT_COLUMNS)
     logger.info(f"Importing courts from {csv_path}")
     cursor = conn.cursor()
 
-    with open(csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with _open_csv(csv_path) as f:
+        reader = csv.reader(f)
+        cols, idx, n_slots = _bind_fields(reader, COURT_FIELDS)
         batch = []
         count = 0
 
         for row in reader:
-            court_data = (
-                parse_value(row['id'], 'id'),
-                parse_value(row.get('full_name', ''), 'full_name'),
-                parse_value(row.get('short_name', ''), 'short_name'),
-                parse_value(row.get('citation_string', ''), 'citation_string'),
-                parse_value(row.get('in_use', 't'), 'in_use'),
-                parse_value(row.get('has_opinion_scraper', 'f'), 'has_opinion_scraper'),
-                parse_value(row.get('has_oral_argument_scraper', 'f'), 'has_oral_argument_scraper'),
-                parse_value(row.get('position', '0'), 'position'),
-            )
+            if len(row) < n_slots:
+                row.extend([''] * (n_slots - len(row)))
+            court_data = tuple([fn(row[j] or d) for j, d, fn in cols])
             batch.append(court_data)
             count += 1
 
             if len(batch) >= batch_size:
-                execute_batch(cursor, """
-                    INSERT INTO search_court
-                    (id, full_name, short_name, citation_string, in_use,
-                     has_opinion_scraper, has_oral_argument_scraper, position)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (id) DO NOTHING
-                """, batch)
-                conn.commit()
+                copy_rows(cursor, 'search_court', COURT_COLUMNS, batch)
                 logger.info(f"✓ Imported {count} courts")
                 batch = []
 
         if batch:
-            execute_batch(cursor, """
-                INSERT INTO search_court
-                (id, full_name, short_name, citation_string, in_use,
-                 has_opinion_scraper, has_oral_argument_scraper, position)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (id) DO NOTHING
-            """, batch)
-            conn.commit()
+            copy_rows(cursor, 'search_court', COURT_COLUMNS, batch)
+        # One commit per file - every commit is a WAL flush
+        conn.commit()
 
     logger.info(f"✓ Imported {count} courts total")
     cursor.close()
 
-def import_dockets(conn, csv_path, batch_size=5000, limit=None):
+def import_dockets(conn, csv_path, batch_size=None, limit=None, db_url=None, workers=1):
+    batch_size = batch_size or default_batch_size(DOCKET_COLUMNS)
     logger.info(f"Importing dockets from {csv_path}")
     cursor = conn.cursor()
+    pool = (CopyPool(db_url, 'search_docket', DOCKET_COLUMNS, workers)
+            if workers > 1 and db_url else None)
 
-    with open(csv_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
+    with _open_csv(csv_path) as f:
+        reader = csv.reader(f)
+        cols, idx, n_slots = _bind_fields(reader, DOCKET_FIELDS)
+        i_court = idx.get('court_id', n_slots - 1)
         batch = []
         count = 0
         skipped = 0
@@ -89,57 +420,48 @@ def import_dockets(conn, csv_path, batch_size=5000, limit=None):
             if limit and count >= limit:
                 break
 
-            if not row.get('court_id'):
+            if len(row) < n_slots:
+                row.extend([''] * (n_slots - len(row)))
+            if not row[i_court]:
                 skipped += 1
                 continue
 
-            docket_data = (
-                parse_value(row['id'], 'id'),
-                parse_value(row.get('date_created'), 'date_created'),
-                parse_value(row.get('date_modified'), 'date_modified'),
-                parse_value(row.get('source', '0'), 'source'),
-                parse_value(row['court_id'], 'court_id'),
-                parse_value(row.get('date_filed'), 'date_filed'),
-                parse_value(row.get('case_name_short'), 'case_name_short'),
-                parse_value(row.get('case_name'), 'case_name'),
-                parse_value(row.get('case_name_full'), 'case_name_full'),
-                parse_value(row.get('slug'), 'slug'),
-                parse_value(row.get('docket_number'), 'docket_number'),
-            )
+            docket_data = tuple([fn(row[j] or d) for j, d, fn in cols])
             batch.append(docket_data)
             count += 1
 
             if len(batch) >= batch_size:
-                execute_batch(cursor, """
-                    INSERT INTO search_docket
-                    (id, date_created, date_modified, source, court_id, date_filed,
-                     case_name_short, case_name, case_name_full, slug, docket_number)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (id) DO NOTHING
-                """, batch, page_size=batch_size)
-                conn.commit()
+                if pool is not None:
+                    pool.submit(batch)
+                else:
+                    copy_rows(cursor, 'search_docket', DOCKET_COLUMNS, batch)
                 logger.info(f"✓ Imported {count} dockets (skipped {skipped})")
                 batch = []
 
         if batch:
-            execute_batch(cursor, """
-                INSERT INTO search_docket
-                (id, date_created, date_modified, source, court_id, date_filed,
-                 case_name_short, case_name, case_name_full, slug, docket_number)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (id) DO NOTHING
-            """, batch)
-            conn.commit()
+            if pool is not None:
+                pool.submit(batch)
+            else:
+                copy_rows(cursor, 'search_docket', DOCKET_COLUMNS, batch)
+        if pool is not None:
+            pool.close()
+        # One commit per file - every commit is a WAL flush
+        conn.commit()
 
     logger.info(f"✓ Imported {count} dockets total (skipped {skipped})")
     cursor.close()
 
-def import_clusters(conn, csv_path, batch_size=5000, limit=None):
+def import_clusters(conn, csv_path, batch_size=None, limit=None, db_url=None, workers=1):
+    batch_size = batch_size or default_batch_size(CLUSTER_COLUMNS)
     logger.info(f"Importing opinion clusters from {csv_path}")
     cursor = conn.cursor()
+    pool = (CopyPool(db_url, 'search_opinioncluster', CLUSTER_COLUMNS, workers)
+            if workers > 1 and db_url else None)
 
-    with open(csv_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
+    with _open_csv(csv_path) as f:
+        reader = csv.reader(f)
+        cols, idx, n_slots = _bind_fields(reader, CLUSTER_FIELDS)
+        i_docket = idx.get('docket_id', n_slots - 1)
         batch = []
         count = 0
         skipped = 0
@@ -148,113 +470,95 @@ def import_clusters(conn, csv_path, batch_size=5000, limit=None):
             if limit and count >= limit:
                 break
 
-            if not row.get('docket_id'):
+            if len(row) < n_slots:
+                row.extend([''] * (n_slots - len(row)))
+            if not row[i_docket]:
                 skipped += 1
                 continue
 
-            cluster_data = (
-                parse_value(row['id'], 'id'),
-                parse_value(row['docket_id'], 'docket_id'),
-                parse_value(row.get('date_created'), 'date_created'),
-                parse_value(row.get('date_modified'), 'date_modified'),
-                parse_value(row.get('judges'), 'judges'),
-                parse_value(row.get('date_filed'), 'date_filed'),
-                parse_value(row.get('date_filed_is_approximate', 'f'), 'date_filed_is_approximate'),
-                parse_value(row.get('slug'), 'slug'),
-                parse_value(row.get('case_name_short'), 'case_name_short'),
-                parse_value(row.get('case_name'), 'case_name'),
-                parse_value(row.get('case_name_full'), 'case_name_full'),
-                parse_value(row.get('source', '0'), 'source'),
-                parse_value(row.get('procedural_history'), 'procedural_history'),
-                parse_value(row.get('attorneys'), 'attorneys'),
-                parse_value(row.get('nature_of_suit'), 'nature_of_suit'),
-                parse_value(row.get('posture'), 'posture'),
-                parse_value(row.get('syllabus'), 'syllabus'),
-                parse_value(row.get('summary'), 'summary'),
-                parse_value(row.get('disposition'), 'disposition'),
-                parse_value(row.get('citation_count', '0'), 'citation_count'),
-                parse_value(row.get('precedential_status', 'Unknown'), 'precedential_status'),
-                parse_value(row.get('blocked', 'f'), 'blocked'),
-            )
+            cluster_data = tuple([fn(row[j] or d) for j, d, fn in cols])
             batch.append(cluster_data)
             count += 1
 
             if len(batch) >= batch_size:
-                execute_batch(cursor, """
-                    INSERT INTO search_opinioncluster
-                    (id, docket_id, date_created, date_modified, judges, date_filed,
-                     date_filed_is_approximate, slug, case_name_short, case_name,
-                     case_name_full, source, procedural_history, attorneys,
-                     nature_of_suit, posture, syllabus, summary, disposition,
-                     citation_count, precedential_status, blocked)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    ON CONFLICT (id) DO NOTHING
-                """, batch, page_size=batch_size)
-                conn.commit()
+                if pool is not None:
+                    pool.submit(batch)
+                else:
+                    copy_rows(cursor, 'search_opinioncluster', CLUSTER_COLUMNS, batch)
                 logger.info(f"✓ Imported {count} clusters (skipped {skipped})")
                 batch = []
 
         if batch:
-            execute_batch(cursor, """
-                INSERT INTO search_opinioncluster
-                (id, docket_id, date_created, date_modified, judges, date_filed,
-                 date_filed_is_approximate, slug, case_name_short, case_name,
-                 case_name_full, source, procedural_history, attorneys,
-                 nature_of_suit, posture, syllabus, summary, disposition,
-                 citation_count, precedential_status, blocked)
-                VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                ON CONFLICT (id) DO NOTHING
-            """, batch)
-            conn.commit()
+            if pool is not None:
+                pool.submit(batch)
+            else:
+                copy_rows(cursor, 'search_opinioncluster', CLUSTER_COLUMNS, batch)
+        if pool is not None:
+            pool.close()
+        # One commit per file - every commit is a WAL flush
+        conn.commit()
 
     logger.info(f"✓ Imported {count} clusters total (skipped {skipped})")
     cursor.close()
 
-def import_citations(conn, csv_path, batch_size=10000, limit=None):
+def import_citations(conn, csv_path, batch_size=None, limit=None):
+    batch_size = batch_size or default_batch_size(CITATION_COLUMNS)
     logger.info(f"Importing citations from {csv_path}")
     cursor = conn.cursor()
 
-    with open(csv_path, 'r', encoding='utf-8', errors='replace') as f:
-        reader = csv.DictReader(f)
-        batch = []
-        count = 0
-        skipped = 0
-
-        for row in reader:
-            if limit and count >= limit:
-                break
-
-            if not row.get('cited_opinion_id') or not row.get('citing_opinion_id'):
-                skipped += 1
-                continue
-
-            citation_data = (
-                parse_value(row['cited_opinion_id'], 'cited_opinion_id'),
-                parse_value(row['citing_opinion_id'], 'citing_opinion_id'),
-                parse_value(row.get('depth', '1'), 'depth'),
-            )
-            batch.append(citation_data)
-            count += 1
-
-            if len(batch) >= batch_size:
-                execute_batch(cursor, """
-                    INSERT INTO search_opinionscited
-                    (cited_opinion_id, citing_opinion_id, depth)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT DO NOTHING
-                """, batch, page_size=batch_size)
-                conn.commit()
-                logger.info(f"✓ Imported {count} citations (skipped {skipped})")
-                batch = []
-
-        if batch:
-            execute_batch(cursor, """
-                INSERT INTO search_opinionscited
-                (cited_opinion_id, citing_opinion_id, depth)
-                VALUES (%s, %s, %s)
-                ON CONFLICT DO NOTHING
-            """, batch)
+    # The citations dump is unquoted integers, so rows split safely on
+    # raw newlines/commas. mmap hands the kernel page cache straight to
+    # bytes slicing - no read() copies and no per-line UTF-8 decode; only
+    # the header is ever decoded. The other dumps carry quoted multiline
+    # text and have to stay on the csv module.
+    with open(csv_path, 'rb') as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mm, 'madvise'):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        try:
+            header = mm.readline().rstrip(b'\r\n').decode('utf-8').split(',')
+            idx = {name: j for j, name in enumerate(header)}
+            i_cited = idx.get('cited_opinion_id')
+            i_citing = idx.get('citing_opinion_id')
+            i_depth = idx.get('depth')
+            if i_cited is None or i_citing is None:
+                logger.error(f"Citations CSV missing id columns: {header}")
+                return
+            n_cols = len(header)
+            batch = []
+            count = 0
+            skipped = 0
+
+            for line in iter(mm.readline, b''):
+                if limit and count >= limit:
+                    break
+
+                row = line.rstrip(b'\r\n').split(b',')
+                if len(row) < n_cols:
+                    skipped += 1
+                    continue
+                cited = row[i_cited]
+                citing = row[i_citing]
+                if not cited.isdigit() or not citing.isdigit():
+                    skipped += 1
+                    continue
+
+                depth = row[i_depth] if i_depth is not None else b''
+                batch.append((int(cited), int(citing),
+                              int(depth) if depth.isdigit() else 1))
+                count += 1
+
+                if len(batch) >= batch_size:
+                    copy_citation_rows(cursor, batch)
+                    logger.info(f"✓ Imported {count} citations (skipped {skipped})")
+                    batch = []
+
+            if batch:
+                copy_citation_rows(cursor, batch)
+            # One commit per file - every commit is a WAL flush
             conn.commit()
+        finally:
+            mm.close()
 
     logger.info(f"✓ Imported {count} citations total (skipped {skipped})")
     cursor.close()
@@ -267,7 +571,17 @@ def main():
     parser.add_argument('--clusters', help='Path to opinion clusters CSV')
     parser.add_argument('--citations', help='Path to citations CSV')
     parser.add_argument('--limit', type=int, help='Limit rows (for testing)')
-    parser.add_argument('--batch-size', type=int, default=5000, help='Batch size')
+    parser.add_argument('--batch-size', type=int, default=None,
+                        help='Rows per COPY batch (default: sized per table '
+                             'to ~8 MiB of payload)')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='Parallel COPY writer connections for dockets/clusters')
+    parser.add_argument('--parallel', action='store_true',
+                        help='Load citations on a second connection while the '
+                             'court/docket/cluster chain runs')
+    parser.add_argument('--bulk-load', action='store_true',
+                        help='Drop secondary indexes and skip FK triggers during '
+                             'the load, rebuilding indexes concurrently after')
 
     args = parser.parse_args()
 
@@ -277,22 +591,70 @@ def main():
         logger.error("DATABASE_URL environment variable not set")
         sys.exit(1)
 
+    index_ddl = []
+    if args.bulk_load:
+        global BULK_LOAD
+        BULK_LOAD = True
+        index_ddl = drop_indexes(db_url, BULK_TABLES)
+
     logger.info(f"Connecting to database...")
     conn = psycopg2.connect(db_url)
+    tune_session(conn)
+    if args.bulk_load:
+        # Rows come from trusted CourtListener dumps; skipping FK-check
+        # triggers here trades validation for per-row trigger overhead
+        with conn.cursor() as cur:
+            cur.execute("SET session_replication_role = replica")
+        conn.commit()
+
+    # FK order pins courts -> dockets -> clusters to one sequential chain,
+    # but citations only reference search_opinion (loaded elsewhere), so
+    # with --parallel they stream on a second backend while the chain runs
+    citations_thread = None
+    citations_errors = []
+
+    def run_citations_parallel():
+        cit_conn = psycopg2.connect(db_url)
+        tune_session(cit_conn)
+        if args.bulk_load:
+            with cit_conn.cursor() as cur:
+                cur.execute("SET session_replication_role = replica")
+            cit_conn.commit()
+        try:
+            import_citations(cit_conn, args.citations,
+                             batch_size=args.batch_size, limit=args.limit)
+        except Exception as e:
+            citations_errors.append(e)
+        finally:
+            cit_conn.close()
 
     try:
+        if args.parallel and args.citations:
+            citations_thread = threading.Thread(target=run_citations_parallel,
+                                                daemon=True)
+            citations_thread.start()
+
         if args.courts:
             import_courts(conn, args.courts, batch_size=args.batch_size)
 
         if args.dockets:
-            import_dockets(conn, args.dockets, batch_size=args.batch_size, limit=args.limit)
+            import_dockets(conn, args.dockets, batch_size=args.batch_size,
+                           limit=args.limit, db_url=db_url, workers=args.workers)
 
         if args.clusters:
-            import_clusters(conn, args.clusters, batch_size=args.batch_size, limit=args.limit)
-
-        if args.citations:
+            import_clusters(conn, args.clusters, batch_size=args.batch_size,
+                            limit=args.limit, db_url=db_url, workers=args.workers)
+
+        if citations_thread is not None:
+            citations_thread.join()
+            if citations_errors:
+                raise citations_errors[0]
+        elif args.citations:
             import_citations(conn, args.citations, batch_size=args.batch_size, limit=args.limit)
 
+        if index_ddl:
+            recreate_indexes(db_url, index_ddl)
+
         logger.info("✅ Import complete!")
 
     except Exception as e:
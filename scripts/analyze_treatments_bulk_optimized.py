@@ -11,6 +11,7 @@ Usage:
 """
 import os
 import sys
+import json
 import logging
 import psycopg2
 from psycopg2.extras import execute_batch
@@ -18,6 +19,13 @@ import re
 from typing import List, Dict, Tuple
 from enum import Enum
 
+# orjson serializes the evidence payloads several times faster than stdlib
+# json; fall back to stdlib when it isn't installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
@@ -78,13 +86,34 @@ NEUTRAL_KEYWORDS = {
     'referenced': 1, 'referencing': 1,
 }
 
-def find_keyword_scores(text: str) -> Tuple[int, int, int]:
+# Stable keyword vocabulary so evidence rows can store small integer IDs
+# instead of repeating keyword strings in every JSON payload
+KEYWORD_VOCAB = (list(NEGATIVE_KEYWORDS) + list(POSITIVE_KEYWORDS)
+                 + list(NEUTRAL_KEYWORDS))
+KEYWORD_ID = {keyword: i for i, keyword in enumerate(KEYWORD_VOCAB)}
+
+# Cheap substring prefilter: every keyword above contains one of these stems.
+# Most parentheticals contain none of the keywords, and ~25 C-level `in`
+# scans are far cheaper than ~60 word-boundary regex searches.
+KEYWORD_TRIGGERS = frozenset({
+    'overrul', 'abrogat', 'revers', 'vacat', 'supersed', 'disapprov',
+    'reject', 'question', 'doubt', 'critic', 'limit', 'narrow',
+    'affirm', 'follow', 'adopt', 'approv', 'appl', 'endors', 'agree',
+    'distinguish', 'explain', 'discuss', 'cit', 'mention', 'referenc',
+})
+
+# A keyword the prefilter can't see would be silently scored as neutral,
+# so fail loudly at import if the stem list ever falls out of sync
+for _keyword in KEYWORD_VOCAB:
+    assert any(t in _keyword for t in KEYWORD_TRIGGERS), \
+        f"keyword {_keyword!r} matches no KEYWORD_TRIGGERS stem"
+del _keyword
+
+def find_keyword_scores(text_lower: str) -> Tuple[int, int, int]:
     """
-    Find keyword scores in text
+    Find keyword scores in already-lowercased text
     Returns: (negative_score, positive_score, neutral_score)
     """
-    text_lower = text.lower()
-
     negative_score = sum(score for keyword, score in NEGATIVE_KEYWORDS.items()
                         if re.search(r'\b' + re.escape(keyword) + r'\b', text_lower))
 
@@ -178,12 +207,11 @@ def get_opinions_to_analyze(conn, limit: int = None, offset: int = 0, force_rean
 
     return opinion_ids
 
-def find_keywords_in_text(text: str) -> Dict[str, List[str]]:
+def find_keywords_in_text(text_lower: str) -> Dict[str, List[str]]:
     """
-    Find specific keywords in text and return by category
+    Find specific keywords in already-lowercased text and return by category
     Returns: {'negative': [...], 'positive': [...], 'neutral': [...]}
     """
-    text_lower = text.lower()
     found = {'negative': [], 'positive': [], 'neutral': []}
 
     for keyword in NEGATIVE_KEYWORDS.keys():
@@ -206,30 +234,31 @@ def analyze_opinion_batch(conn, opinion_ids: List[int]) -> List[Dict]:
     """
     cursor = conn.cursor()
 
-    # Fetch all parentheticals for these opinions with describing opinion ID
+    # Fetch all parentheticals for these opinions with describing opinion ID.
+    # Only project the columns we actually use - `score` was fetched but never
+    # read, which is real wire traffic at tens of millions of rows.
     cursor.execute("""
-        SELECT described_opinion_id, text, describing_opinion_id, score
+        SELECT described_opinion_id, text, describing_opinion_id
         FROM search_parenthetical
         WHERE described_opinion_id = ANY(%s)
     """, (opinion_ids,))
 
-    # Group parentheticals by opinion
+    # Group parentheticals by opinion as plain (text, describing_id) tuples
+    # to avoid a per-row dict allocation
     opinion_parentheticals = {}
-    for opinion_id, text, describing_id, score in cursor.fetchall():
+    for opinion_id, text, describing_id in cursor:
         if opinion_id not in opinion_parentheticals:
             opinion_parentheticals[opinion_id] = []
-        opinion_parentheticals[opinion_id].append({
-            'text': text,
-            'describing_opinion_id': describing_id,
-            'score': score
-        })
+        opinion_parentheticals[opinion_id].append((text, describing_id))
 
     cursor.close()
 
     # Analyze each opinion
     results = []
     for opinion_id in opinion_ids:
-        parentheticals = opinion_parentheticals.get(opinion_id, [])
+        # Pop so the input dict shrinks as results grow - keeps peak RSS to
+        # roughly one copy of the batch instead of two
+        parentheticals = opinion_parentheticals.pop(opinion_id, None)
 
         if not parentheticals:
             continue
@@ -246,32 +275,40 @@ def analyze_opinion_batch(conn, opinion_ids: List[int]) -> List[Dict]:
         negative_examples = []
         positive_examples = []
 
-        for p in parentheticals:
-            text = p['text']
-            neg, pos, neu = find_keyword_scores(text)
+        for text, describing_id in parentheticals:
+            # Lowercase once per parenthetical; both helpers take the
+            # already-lowered text
+            text_lower = text.lower()
+
+            # Fast path: no keyword stem present means every regex below
+            # would miss, so go straight to the neutral branch
+            if not any(t in text_lower for t in KEYWORD_TRIGGERS):
+                neutral_count += 1
+                continue
+
+            neg, pos, neu = find_keyword_scores(text_lower)
             total_negative += neg
             total_positive += pos
             total_neutral += neu
 
             # Find specific keywords for evidence
-            keywords = find_keywords_in_text(text)
+            keywords = find_keywords_in_text(text_lower)
 
             if neg > 0:
                 negative_count += 1
-                negative_examples.append({
-                    'text': text[:300],  # Truncate to 300 chars
-                    'keywords': keywords['negative'],
-                    'score': neg,
-                    'describing_opinion_id': p['describing_opinion_id']
-                })
+                # Compact (score, describing_opinion_id, keyword_ids) tuple -
+                # display text is reconstructed from search_parenthetical at
+                # read time instead of copying it into every evidence row
+                negative_examples.append(
+                    (neg, describing_id,
+                     [KEYWORD_ID[k] for k in keywords['negative']])
+                )
             elif pos > 0:
                 positive_count += 1
-                positive_examples.append({
-                    'text': text[:300],
-                    'keywords': keywords['positive'],
-                    'score': pos,
-                    'describing_opinion_id': p['describing_opinion_id']
-                })
+                positive_examples.append(
+                    (pos, describing_id,
+                     [KEYWORD_ID[k] for k in keywords['positive']])
+                )
             else:
                 neutral_count += 1
 
@@ -281,15 +318,20 @@ def analyze_opinion_batch(conn, opinion_ids: List[int]) -> List[Dict]:
             negative_count, positive_count
         )
 
-        # Sort examples by score and take top 5
-        negative_examples.sort(key=lambda x: x['score'], reverse=True)
-        positive_examples.sort(key=lambda x: x['score'], reverse=True)
+        # Sort examples by score and trim to top 5 in place (no copies)
+        negative_examples.sort(reverse=True)
+        positive_examples.sort(reverse=True)
+        del negative_examples[5:]
+        del positive_examples[5:]
 
-        # Build evidence object
+        # Build evidence object - each example is [describing_opinion_id,
+        # score, [keyword_id, ...]] with keyword IDs indexing KEYWORD_VOCAB;
+        # full text comes from a JOIN on search_parenthetical when displayed
         evidence = {
             'summary': f"{treatment_type} based on {negative_count} negative, {positive_count} positive, {neutral_count} neutral parentheticals",
-            'negative_examples': negative_examples[:5],  # Top 5 negative
-            'positive_examples': positive_examples[:5],  # Top 5 positive
+            'keyword_vocab': 0,  # version of KEYWORD_VOCAB used for IDs
+            'neg': [[did, score, kids] for score, did, kids in negative_examples],
+            'pos': [[did, score, kids] for score, did, kids in positive_examples],
             'total_negative_score': total_negative,
             'total_positive_score': total_positive
         }
@@ -308,6 +350,93 @@ def analyze_opinion_batch(conn, opinion_ids: List[int]) -> List[Dict]:
 
     return results
 
+def _keyword_score_sql(keywords: Dict[str, int]) -> str:
+    """Build a SQL expression summing keyword scores via word-boundary regex"""
+    return ' + '.join(
+        f"(CASE WHEN p.text ~* '\\y{keyword}\\y' THEN {score} ELSE 0 END)"
+        for keyword, score in keywords.items()
+    )
+
+def analyze_in_database(conn, opinion_ids: List[int]) -> int:
+    """
+    Classify a batch of opinions entirely inside Postgres.
+
+    Mirrors find_keyword_scores + classify_treatment in SQL so no
+    parenthetical text ever crosses the wire. Evidence examples are not
+    produced in this mode (the Python path remains the default when
+    evidence is needed).
+    """
+    cursor = conn.cursor()
+
+    query = f"""
+        INSERT INTO citation_treatment
+        (opinion_id, treatment_type, severity, confidence,
+         negative_count, positive_count, neutral_count, evidence, last_updated)
+        SELECT opinion_id,
+               CASE
+                   WHEN neg_score > 0 OR neg_count > 0 THEN
+                       CASE
+                           WHEN neg_score >= 10 THEN 'OVERRULED'
+                           WHEN neg_score >= 9 THEN 'REVERSED'
+                           WHEN neg_score >= 6 THEN 'QUESTIONED'
+                           ELSE 'CRITICIZED'
+                       END
+                   WHEN pos_score > neu_score THEN
+                       CASE WHEN pos_score >= 8 THEN 'AFFIRMED' ELSE 'FOLLOWED' END
+                   ELSE 'CITED'
+               END,
+               CASE
+                   WHEN neg_score > 0 OR neg_count > 0 THEN 'NEGATIVE'
+                   WHEN pos_score > neu_score THEN 'POSITIVE'
+                   ELSE 'NEUTRAL'
+               END,
+               CASE
+                   WHEN neg_score > 0 OR neg_count > 0 THEN LEAST(1.0, 0.6 + neg_count * 0.1)
+                   WHEN pos_score > neu_score THEN LEAST(1.0, 0.4 + pos_count * 0.05)
+                   ELSE 0.3
+               END,
+               neg_count, pos_count, neu_count, NULL, NOW()
+        FROM (
+            SELECT opinion_id,
+                   SUM(neg) AS neg_score,
+                   SUM(pos) AS pos_score,
+                   SUM(neu) AS neu_score,
+                   COUNT(*) FILTER (WHERE neg > 0) AS neg_count,
+                   COUNT(*) FILTER (WHERE neg = 0 AND pos > 0) AS pos_count,
+                   COUNT(*) FILTER (WHERE neg = 0 AND pos = 0) AS neu_count
+            FROM (
+                SELECT p.described_opinion_id AS opinion_id,
+                       {_keyword_score_sql(NEGATIVE_KEYWORDS)} AS neg,
+                       {_keyword_score_sql(POSITIVE_KEYWORDS)} AS pos,
+                       {_keyword_score_sql(NEUTRAL_KEYWORDS)} AS neu
+                FROM search_parenthetical p
+                WHERE p.described_opinion_id = ANY(%s)
+            ) scored
+            GROUP BY opinion_id
+        ) agg
+        ON CONFLICT (opinion_id)
+        DO UPDATE SET
+            treatment_type = EXCLUDED.treatment_type,
+            severity = EXCLUDED.severity,
+            confidence = EXCLUDED.confidence,
+            negative_count = EXCLUDED.negative_count,
+            positive_count = EXCLUDED.positive_count,
+            neutral_count = EXCLUDED.neutral_count,
+            last_updated = NOW()
+    """
+
+    try:
+        cursor.execute(query, (opinion_ids,))
+        saved = cursor.rowcount
+        conn.commit()
+        return saved
+    except Exception as e:
+        logger.error(f"Error analyzing in database: {e}")
+        conn.rollback()
+        return 0
+    finally:
+        cursor.close()
+
 def save_treatments(conn, results: List[Dict]) -> int:
     """
     Save treatment results to database with evidence
@@ -317,9 +446,12 @@ def save_treatments(conn, results: List[Dict]) -> int:
 
     cursor = conn.cursor()
 
-    try:
-        import json
+    if orjson is not None:
+        dumps = lambda obj: orjson.dumps(obj).decode()
+    else:
+        dumps = json.dumps
 
+    try:
         # Use UPSERT to handle duplicates
         values = [
             (
@@ -330,7 +462,7 @@ def save_treatments(conn, results: List[Dict]) -> int:
                 r['negative_count'],
                 r['positive_count'],
                 r['neutral_count'],
-                json.dumps(r['evidence'])  # Convert evidence dict to JSON
+                dumps(r['evidence'])  # Convert evidence dict to JSON
             )
             for r in results
         ]
@@ -406,6 +538,8 @@ def main():
                        help='Only show statistics')
     parser.add_argument('--force-reanalyze', action='store_true',
                        help='Re-analyze opinions that lack evidence')
+    parser.add_argument('--in-database', action='store_true',
+                       help='Run classification inside Postgres (no text transfer, no evidence examples)')
 
     args = parser.parse_args()
 
@@ -453,11 +587,15 @@ def main():
         for i in range(0, total_to_analyze, batch_size):
             batch = opinion_ids[i:i + batch_size]
 
-            # Analyze batch
-            results = analyze_opinion_batch(conn, batch)
+            if args.in_database:
+                # Classification runs entirely inside Postgres
+                saved = analyze_in_database(conn, batch)
+            else:
+                # Analyze batch
+                results = analyze_opinion_batch(conn, batch)
 
-            # Save results
-            saved = save_treatments(conn, results)
+                # Save results
+                saved = save_treatments(conn, results)
             analyzed_count += saved
 
             # Progress report
@@ -7,15 +7,26 @@ This script:
 2. Fetches text from CourtListener API (respecting rate limits)
 3. Caches the text in your database
 
+Fetches run concurrently over a shared httpx.AsyncClient, paced by a token
+bucket so network latency overlaps with rate-limit wait time instead of
+stacking on top of it.
+
 Usage:
     python scripts/fetch_all_opinions.py --limit 1000 --batch-size 100
 """
 import os
 import sys
 import time
+import json
+import asyncio
 import logging
 import httpx
 import psycopg2
+from psycopg2.extras import execute_values
+from collections import deque
+from itertools import islice
+
+from opinion_body_store import OpinionBodyStore
 from typing import Optional
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -23,36 +34,181 @@ logger = logging.getLogger(__name__)
 
 # CourtListener API configuration
 COURTLISTENER_API_BASE = "https://www.courtlistener.com/api/rest/v4"
-RATE_LIMIT_DELAY = 0.72  # 5000 requests/hour = 1.39 requests/second = 0.72s between requests
+RATE_LIMIT = 1.39  # requests/second (5000 requests/hour)
+MAX_CONCURRENCY = 8  # in-flight requests; bursts are capped by the bucket
+
+class TokenBucket:
+    """Paces requests at `rate` tokens/second with a small burst capacity"""
+
+    def __init__(self, rate: float, capacity: float = 4.0):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def take(self, amount: float = 1.0):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity,
+                                  self.tokens + (now - self.last_refill) * self.rate)
+                self.last_refill = now
+                if self.tokens >= amount:
+                    self.tokens -= amount
+                    return
+                await asyncio.sleep((amount - self.tokens) / self.rate)
+
+    def drain(self):
+        """Drop accumulated burst tokens (e.g. when the API says slow down)"""
+        self.tokens = 0.0
+        self.last_refill = time.monotonic()
+
+class AIMDController:
+    """
+    Additive-increase/multiplicative-decrease concurrency control.
 
-def fetch_opinion_text(opinion_id: int, api_token: str) -> Optional[dict]:
-    """Fetch opinion text from CourtListener API"""
-    headers = {
-        "Authorization": f"Token {api_token}"
-    }
+    A 429 or 5xx multiplies the concurrency target (and request rate) by
+    `beta`; a clean window of responses adds `alpha` back, so throughput
+    settles near the provider ceiling across time-of-day load swings
+    instead of relying on one hard-coded delay.
+    """
 
+    def __init__(self, bucket: TokenBucket, initial: float = MAX_CONCURRENCY,
+                 floor: float = 1.0, ceiling: float = MAX_CONCURRENCY,
+                 alpha: float = 0.5, beta: float = 0.5, window: int = 50):
+        self.bucket = bucket
+        self.c_t = float(initial)
+        self.floor = floor
+        self.ceiling = ceiling
+        self.alpha = alpha
+        self.beta = beta
+        self.statuses = deque(maxlen=window)
+
+    @property
+    def limit(self) -> int:
+        return max(1, int(self.c_t))
+
+    def record(self, status: int, latency: float):
+        self.statuses.append(status)
+        if status == 429 or status >= 500:
+            self.c_t = max(self.floor, self.c_t * self.beta)
+            self.bucket.rate = max(RATE_LIMIT * 0.1, self.bucket.rate * self.beta)
+            self.bucket.drain()
+            self.statuses.clear()
+            logger.info(f"Backpressure: concurrency -> {self.limit}, "
+                        f"rate -> {self.bucket.rate:.2f}/s")
+
+    def end_window(self):
+        """Additively restore after a window with no throttling responses"""
+        if self.statuses and all(s < 429 for s in self.statuses):
+            self.c_t = min(self.ceiling, self.c_t + self.alpha)
+            self.bucket.rate = min(RATE_LIMIT, self.bucket.rate + 0.1)
+
+def make_async_client(api_token: str) -> httpx.AsyncClient:
+    """Shared client with keep-alive connections (HTTP/2 when h2 installed)"""
+    kwargs = dict(
+        headers={"Authorization": f"Token {api_token}"},
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=30.0,
+        follow_redirects=True,
+    )
     try:
-        response = httpx.get(
-            f"{COURTLISTENER_API_BASE}/opinions/{opinion_id}/",
-            headers=headers,
-            timeout=30.0,
-            follow_redirects=True
-        )
-        response.raise_for_status()
-        return response.json()
-    except httpx.HTTPStatusError as e:
-        if e.response.status_code == 404:
-            logger.warning(f"Opinion {opinion_id} not found on CourtListener (404)")
-            return None
-        elif e.response.status_code == 429:
-            logger.error(f"Rate limit exceeded (429). Increase delay between requests.")
-            return None
-        else:
-            logger.error(f"HTTP error {e.response.status_code} for opinion {opinion_id}")
-            return None
+        return httpx.AsyncClient(http2=True, **kwargs)
+    except ImportError:
+        # h2 not installed; HTTP/1.1 keep-alive still reuses connections
+        return httpx.AsyncClient(**kwargs)
+
+FETCH_BATCH_SIZE = 100  # max page_size the CourtListener list endpoint allows
+FETCH_FIELDS = "id,plain_text,html,html_with_citations,download_url,sha1,extracted_by_ocr"
+
+async def fetch_opinions_batch(client: httpx.AsyncClient, opinion_ids: list,
+                               bucket: TokenBucket,
+                               semaphore: asyncio.Semaphore,
+                               controller: AIMDController) -> list:
+    """
+    Fetch up to 100 opinions in one request via the `?id__in=` list filter.
+
+    One rate-limit token now buys a whole page of opinions instead of a
+    single one. Follows `next` links if the API paginates the result.
+    """
+    results = []
+    url = (f"{COURTLISTENER_API_BASE}/opinions/"
+           f"?id__in={','.join(map(str, opinion_ids))}"
+           f"&page_size={FETCH_BATCH_SIZE}&fields={FETCH_FIELDS}")
+
+    async with semaphore:
+        while url:
+            await bucket.take()
+            start = time.monotonic()
+            try:
+                response = await client.get(url)
+                controller.record(response.status_code, time.monotonic() - start)
+                response.raise_for_status()
+
+                # Reactively back off when the API reports a low remaining quota
+                remaining = response.headers.get('X-RateLimit-Remaining')
+                if remaining is not None and remaining.isdigit() and int(remaining) < 10:
+                    bucket.drain()
+
+                payload = response.json()
+                results.extend(payload.get('results', []))
+                url = payload.get('next')
+            except httpx.HTTPStatusError as e:
+                if e.response.status_code == 429:
+                    logger.error(f"Rate limit exceeded (429). Backing off.")
+                else:
+                    logger.error(f"HTTP error {e.response.status_code} for opinion batch "
+                                 f"starting at {opinion_ids[0]}")
+                break
+            except Exception as e:
+                logger.error(f"Error fetching opinion batch starting at {opinion_ids[0]}: {e}")
+                break
+
+    return results
+
+UPDATE_FLUSH_SIZE = 500  # opinions buffered before one bulk UPDATE
+
+def flush_updates(conn, pending: list) -> int:
+    """
+    Apply buffered opinion updates as one UPDATE ... FROM (VALUES ...) per
+    batch - one parsed statement and one commit instead of a round-trip
+    and WAL flush per opinion. Falls back to row-at-a-time on failure so
+    a single bad row doesn't lose the batch.
+    """
+    if not pending:
+        return 0
+
+    cursor = conn.cursor()
+    try:
+        execute_values(cursor, """
+            UPDATE search_opinion AS o
+            SET plain_text = v.plain_text,
+                html = v.html,
+                html_with_citations = v.html_with_citations,
+                download_url = v.download_url,
+                sha1 = v.sha1,
+                extracted_by_ocr = v.extracted_by_ocr,
+                date_modified = NOW()
+            FROM (VALUES %s) AS v(id, plain_text, html, html_with_citations,
+                                  download_url, sha1, extracted_by_ocr)
+            WHERE o.id = v.id
+        """, pending, template="(%s, %s, %s, %s, %s, %s, %s)",
+            page_size=UPDATE_FLUSH_SIZE)
+        conn.commit()
+        return len(pending)
     except Exception as e:
-        logger.error(f"Error fetching opinion {opinion_id}: {e}")
-        return None
+        logger.error(f"Bulk update failed, retrying row-by-row: {e}")
+        conn.rollback()
+        saved = 0
+        for row in pending:
+            data = dict(zip(('plain_text', 'html', 'html_with_citations',
+                             'download_url', 'sha1', 'extracted_by_ocr'), row[1:]))
+            if update_opinion_in_db(conn, row[0], data):
+                saved += 1
+        return saved
+    finally:
+        cursor.close()
 
 def update_opinion_in_db(conn, opinion_id: int, data: dict):
     """Update opinion text and metadata in database"""
@@ -86,26 +242,162 @@ def update_opinion_in_db(conn, opinion_id: int, data: dict):
     finally:
         cursor.close()
 
-def get_opinions_without_text(conn, limit: Optional[int] = None):
-    """Get opinion IDs that don't have text"""
+# A row with sha1 set has already been fetched - with --body-store its
+# HTML lives in the on-disk store rather than the text columns - so it
+# must not count as missing, or every store-backed opinion would be
+# re-fetched on each run.
+MISSING_TEXT_WHERE = """
+    WHERE (plain_text IS NULL OR plain_text = '')
+      AND (html IS NULL OR html = '')
+      AND (sha1 IS NULL OR sha1 = '')
+"""
+
+def count_opinions_without_text(conn, limit: Optional[int] = None,
+                                start_from: Optional[int] = None) -> int:
+    """Cheap count so progress/ETA work while IDs stream in"""
     cursor = conn.cursor()
+    query = f"SELECT COUNT(*) FROM search_opinion {MISSING_TEXT_WHERE}"
+    if start_from:
+        query += f" AND id >= {int(start_from)}"
+    cursor.execute(query)
+    total = cursor.fetchone()[0]
+    cursor.close()
+    if limit:
+        total = min(total, limit)
+    return total
+
+def iter_opinions_without_text(conn, limit: Optional[int] = None,
+                               start_from: Optional[int] = None):
+    """
+    Stream opinion IDs that don't have text.
 
-    query = """
-        SELECT id
-        FROM search_opinion
-        WHERE (plain_text IS NULL OR plain_text = '')
-          AND (html IS NULL OR html = '')
-        ORDER BY id
+    Uses a server-side named cursor so only itersize rows are buffered at
+    a time instead of materializing millions of IDs up front; fetching can
+    start while the scan is still running. withhold=True keeps the cursor
+    alive across the commits issued by the update flushes.
     """
+    cursor = conn.cursor(name='opinions_without_text', withhold=True)
+    cursor.itersize = 10000
 
+    query = f"SELECT id FROM search_opinion {MISSING_TEXT_WHERE}"
+    if start_from:
+        query += f" AND id >= {int(start_from)}"
+    query += " ORDER BY id"
     if limit:
         query += f" LIMIT {limit}"
 
     cursor.execute(query)
-    opinion_ids = [row[0] for row in cursor.fetchall()]
-    cursor.close()
+    try:
+        for row in cursor:
+            yield row[0]
+    finally:
+        cursor.close()
 
-    return opinion_ids
+async def fetch_and_cache(conn, opinion_id_iter, total_opinions, api_token,
+                          batch_size, body_store=None):
+    """Fetch opinions concurrently in chunks and cache each chunk in the DB"""
+    fetched = 0
+    cached = 0
+    not_found = 0
+    errors = 0
+    pending = []  # fetched rows waiting for the next bulk UPDATE
+    start_time = time.time()
+
+    bucket = TokenBucket(rate=RATE_LIMIT, capacity=MAX_CONCURRENCY)
+    controller = AIMDController(bucket)
+
+    page_size = min(batch_size, FETCH_BATCH_SIZE)
+
+    def next_batches(n):
+        """Pull up to n batches of IDs off the streaming cursor"""
+        window = []
+        for _ in range(n):
+            ids = list(islice(opinion_id_iter, page_size))
+            if not ids:
+                break
+            window.append(ids)
+        return window
+
+    async with make_async_client(api_token) as client:
+        i = 0
+        while True:
+            # Semaphore is rebuilt per window so AIMD adjustments take effect
+            semaphore = asyncio.Semaphore(controller.limit)
+            window = next_batches(controller.limit)
+            if not window:
+                break
+
+            window_results = await asyncio.gather(*(
+                fetch_opinions_batch(client, ids, bucket, semaphore, controller)
+                for ids in window
+            ))
+            controller.end_window()
+
+            for ids, rows in zip(window, window_results):
+                by_id = {row.get('id'): row for row in rows}
+                for opinion_id in ids:
+                    fetched += 1
+                    data = by_id.get(opinion_id)
+                    if data is None:
+                        not_found += 1
+                    elif data.get('plain_text') or data.get('html'):
+                        html = data.get('html')
+                        html_citations = data.get('html_with_citations')
+                        # With a body store, the bulky HTML goes to zstd
+                        # shards on disk and only NULLs hit the DB row;
+                        # search_opinion.sha1 is the lookup key
+                        if body_store is not None and data.get('sha1') \
+                                and (html or html_citations):
+                            body_store.put(data['sha1'], json.dumps({
+                                'html': html,
+                                'html_with_citations': html_citations,
+                            }))
+                            html = None
+                            html_citations = None
+                        pending.append((
+                            opinion_id,
+                            data.get('plain_text'),
+                            html,
+                            html_citations,
+                            data.get('download_url'),
+                            data.get('sha1'),
+                            data.get('extracted_by_ocr'),
+                        ))
+                    else:
+                        not_found += 1
+
+            if len(pending) >= UPDATE_FLUSH_SIZE:
+                saved = flush_updates(conn, pending)
+                cached += saved
+                errors += len(pending) - saved
+                pending = []
+
+            # Progress reporting per window
+            i += sum(len(ids) for ids in window)
+            elapsed = time.time() - start_time
+            rate = fetched / elapsed if elapsed > 0 else 0
+            remaining = total_opinions - i
+            eta_seconds = remaining / rate if rate > 0 else 0
+            eta_hours = eta_seconds / 3600
+
+            logger.info(
+                f"Progress: {i}/{total_opinions} ({i/total_opinions*100:.1f}%) | "
+                f"Cached: {cached} | Not found: {not_found} | Errors: {errors} | "
+                f"Rate: {rate:.2f}/s | ETA: {eta_hours:.1f}h"
+            )
+
+    # Flush whatever is still buffered
+    saved = flush_updates(conn, pending)
+    cached += saved
+    errors += len(pending) - saved
+
+    return {
+        'fetched': fetched,
+        'cached': cached,
+        'not_found': not_found,
+        'errors': errors,
+        'elapsed': time.time() - start_time,
+    }
 
 def main():
     import argparse
@@ -113,10 +405,13 @@ def main():
     parser = argparse.ArgumentParser(description='Fetch opinion text from CourtListener API')
     parser.add_argument('--limit', type=int, help='Limit number of opinions to fetch')
     parser.add_argument('--batch-size', type=int, default=100,
-                       help='Number of opinions to fetch before reporting progress')
+                       help='Opinions per API request via id__in (max 100)')
     parser.add_argument('--start-from', type=int, help='Start from specific opinion ID')
     parser.add_argument('--database-url', help='Database URL (or use DATABASE_URL env var)')
     parser.add_argument('--api-token', help='CourtListener API token (or use COURTLISTENER_API_TOKEN env var)')
+    parser.add_argument('--body-store',
+                       help='Directory for the zstd opinion body store; HTML bodies '
+                            'go there (keyed by sha1) instead of Postgres TOAST')
 
     args = parser.parse_args()
 
@@ -142,12 +437,8 @@ def main():
 
     # Get opinions without text
     logger.info("Finding opinions without text...")
-    opinion_ids = get_opinions_without_text(conn, limit=args.limit)
-
-    if args.start_from:
-        opinion_ids = [oid for oid in opinion_ids if oid >= args.start_from]
-
-    total_opinions = len(opinion_ids)
+    total_opinions = count_opinions_without_text(conn, limit=args.limit,
+                                                 start_from=args.start_from)
     logger.info(f"Found {total_opinions} opinions without text")
 
     if total_opinions == 0:
@@ -155,65 +446,37 @@ def main():
         conn.close()
         return
 
-    # Estimate time
-    estimated_seconds = total_opinions * RATE_LIMIT_DELAY
+    # Estimate time - each request now carries up to a full page of opinions
+    page_size = min(args.batch_size, FETCH_BATCH_SIZE)
+    estimated_seconds = (total_opinions / page_size) / RATE_LIMIT
     estimated_hours = estimated_seconds / 3600
     logger.info(f"Estimated time: {estimated_hours:.1f} hours (respecting 5000 req/hour rate limit)")
 
     # Fetch and cache opinions
     logger.info("Starting to fetch opinions from CourtListener API...")
-    logger.info(f"Rate limit: {RATE_LIMIT_DELAY:.2f}s between requests")
+    logger.info(f"Rate limit: {RATE_LIMIT:.2f} requests/s, {MAX_CONCURRENCY} concurrent")
 
-    fetched = 0
-    cached = 0
-    not_found = 0
-    errors = 0
-    start_time = time.time()
-
-    for i, opinion_id in enumerate(opinion_ids, 1):
-        # Fetch from API
-        data = fetch_opinion_text(opinion_id, api_token)
-        fetched += 1
-
-        if data is None:
-            not_found += 1
-        elif data.get('plain_text') or data.get('html'):
-            # Update database with full data
-            if update_opinion_in_db(conn, opinion_id, data):
-                cached += 1
-            else:
-                errors += 1
-        else:
-            not_found += 1
-
-        # Progress reporting
-        if i % args.batch_size == 0 or i == total_opinions:
-            elapsed = time.time() - start_time
-            rate = fetched / elapsed if elapsed > 0 else 0
-            remaining = total_opinions - i
-            eta_seconds = remaining / rate if rate > 0 else 0
-            eta_hours = eta_seconds / 3600
-
-            logger.info(
-                f"Progress: {i}/{total_opinions} ({i/total_opinions*100:.1f}%) | "
-                f"Cached: {cached} | Not found: {not_found} | Errors: {errors} | "
-                f"Rate: {rate:.2f}/s | ETA: {eta_hours:.1f}h"
-            )
+    body_store = None
+    if args.body_store:
+        body_store = OpinionBodyStore(args.body_store)
+        logger.info(f"Storing opinion HTML in zstd body store at {args.body_store}")
 
-        # Rate limiting
-        if i < total_opinions:  # Don't delay after last request
-            time.sleep(RATE_LIMIT_DELAY)
+    opinion_id_iter = iter_opinions_without_text(conn, limit=args.limit,
+                                                 start_from=args.start_from)
+    stats = asyncio.run(fetch_and_cache(conn, opinion_id_iter, total_opinions,
+                                        api_token, args.batch_size,
+                                        body_store=body_store))
 
     # Final summary
-    elapsed = time.time() - start_time
+    elapsed = stats['elapsed']
     logger.info("=" * 80)
     logger.info("✅ Fetch complete!")
-    logger.info(f"Total opinions processed: {fetched}")
-    logger.info(f"Successfully cached: {cached}")
-    logger.info(f"Not found on CourtListener: {not_found}")
-    logger.info(f"Errors: {errors}")
+    logger.info(f"Total opinions processed: {stats['fetched']}")
+    logger.info(f"Successfully cached: {stats['cached']}")
+    logger.info(f"Not found on CourtListener: {stats['not_found']}")
+    logger.info(f"Errors: {stats['errors']}")
     logger.info(f"Total time: {elapsed/3600:.2f} hours")
-    logger.info(f"Average rate: {fetched/elapsed:.2f} requests/second")
+    logger.info(f"Average rate: {stats['fetched']/elapsed:.2f} requests/second")
     logger.info("=" * 80)
 
     conn.close()
@@ -11,6 +11,7 @@ Usage:
         --output opinions-filtered.csv
 """
 import csv
+import io
 import psycopg2
 import os
 import sys
@@ -20,6 +21,28 @@ from pathlib import Path
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Optional Bloom filter used as a fast negative prefilter in front of the
+# authoritative cluster-id set (pip install pybloom-live)
+try:
+    from pybloom_live import BloomFilter
+except ImportError:
+    BloomFilter = None
+
+def build_cluster_prefilter(cluster_ids):
+    """
+    Build a Bloom filter screening rows before the authoritative set probe.
+
+    The bit array stays cache-resident while a multi-million-entry str set
+    does not, so rows with unknown cluster_ids are rejected without
+    touching the big set. Returns None when pybloom_live is absent.
+    """
+    if BloomFilter is None or not cluster_ids:
+        return None
+    bf = BloomFilter(capacity=len(cluster_ids) * 2, error_rate=1e-4)
+    for cluster_id in cluster_ids:
+        bf.add(cluster_id)
+    return bf
+
 def get_valid_cluster_ids(database_url):
     """Get all cluster IDs from the database"""
     logger.info("Connecting to database...")
@@ -27,8 +50,11 @@ def get_valid_cluster_ids(database_url):
     cursor = conn.cursor()
 
     logger.info("Loading cluster IDs from database...")
-    cursor.execute("SELECT id FROM search_opinioncluster")
-    cluster_ids = set(str(row[0]) for row in cursor.fetchall())
+    # COPY streams the whole column in one pass, skipping psycopg2's
+    # per-row tuple building and type adapters
+    buf = io.BytesIO()
+    cursor.copy_expert("COPY (SELECT id FROM search_opinioncluster) TO STDOUT", buf)
+    cluster_ids = set(buf.getvalue().decode('ascii').split())
 
     cursor.close()
     conn.close()
@@ -48,8 +74,14 @@ def filter_opinions(input_path, output_path, valid_clusters):
     skipped_count = 0
     total_count = 0
 
+    prefilter = build_cluster_prefilter(valid_clusters)
+    if prefilter is not None:
+        logger.info("Using Bloom prefilter for cluster membership")
+
+    # 1 MiB output buffer batches kept rows into large sequential writes
     with open(input_path, 'r', encoding='utf-8', errors='replace') as infile:
-        with open(output_path, 'w', encoding='utf-8', newline='') as outfile:
+        with open(output_path, 'w', encoding='utf-8', newline='',
+                  buffering=1 << 20) as outfile:
             reader = csv.DictReader(infile)
             writer = csv.DictWriter(outfile, fieldnames=reader.fieldnames)
             writer.writeheader()
@@ -57,9 +89,12 @@ def filter_opinions(input_path, output_path, valid_clusters):
             for row in reader:
                 total_count += 1
 
-                # Check if cluster_id exists in our database
+                # Check if cluster_id exists in our database; the Bloom
+                # filter rejects most misses before the big set probe
                 cluster_id = row.get('cluster_id', '')
-                if cluster_id and cluster_id in valid_clusters:
+                if cluster_id and \
+                        (prefilter is None or cluster_id in prefilter) and \
+                        cluster_id in valid_clusters:
                     writer.writerow(row)
                     kept_count += 1
                 else:
@@ -4,6 +4,11 @@ Filter opinions CSV directly from compressed file without full extraction.
 
 This saves disk space by streaming the decompression and filtering in one pass.
 
+For very large dumps prefer --engine arrow (or --to-database): those paths
+run the parse/filter loop in compiled code (PyArrow's C++ CSV reader with a
+vectorized is_in mask, or Postgres COPY), leaving decompression as the
+bottleneck rather than per-row Python interpretation.
+
 Usage:
     python scripts/filter_opinions_streaming.py \
         --input opinions-2025-10-31.csv.bz2 \
@@ -11,13 +16,34 @@ Usage:
         --database-url "postgresql://..."
 """
 import csv
+import io
 import psycopg2
 import os
+import queue
+import shutil
+import subprocess
 import sys
+import threading
 import logging
 import bz2
 from pathlib import Path
 
+# PyArrow's C++ CSV reader filters record batches without per-row Python
+# work; fall back to the pure-Python loop when it isn't installed
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# Optional Bloom filter used as a fast negative prefilter in front of the
+# authoritative cluster-id set (pip install pybloom-live)
+try:
+    from pybloom_live import BloomFilter
+except ImportError:
+    BloomFilter = None
+
 # Increase CSV field size limit for large opinion texts
 csv.field_size_limit(10 * 1024 * 1024)  # 10MB limit
 
@@ -31,8 +57,11 @@ def get_valid_cluster_ids(database_url):
     cursor = conn.cursor()
 
     logger.info("Loading cluster IDs from database...")
-    cursor.execute("SELECT id FROM search_opinioncluster")
-    cluster_ids = set(str(row[0]) for row in cursor.fetchall())
+    # COPY streams the whole column in one pass, skipping psycopg2's
+    # per-row tuple building and type adapters
+    buf = io.BytesIO()
+    cursor.copy_expert("COPY (SELECT id FROM search_opinioncluster) TO STDOUT", buf)
+    cluster_ids = set(buf.getvalue().decode('ascii').split())
 
     cursor.close()
     conn.close()
@@ -40,8 +69,197 @@ def get_valid_cluster_ids(database_url):
     logger.info(f"Found {len(cluster_ids)} clusters in database")
     return cluster_ids
 
+def build_cluster_prefilter(cluster_ids):
+    """
+    Build a Bloom filter screening rows before the authoritative set probe.
+
+    The bit array stays cache-resident while a multi-million-entry str set
+    does not, so the ~99% of rows with unknown cluster_ids are rejected
+    without touching the big set. Returns None when pybloom_live is absent.
+    """
+    if BloomFilter is None or not cluster_ids:
+        return None
+    bf = BloomFilter(capacity=len(cluster_ids) * 2, error_rate=1e-4)
+    for cluster_id in cluster_ids:
+        bf.add(cluster_id)
+    return bf
+
+def open_decompressed(input_path):
+    """
+    Open a .bz2 file as a decompressed text stream.
+
+    Prefers lbzip2/pbzip2 piped through a subprocess - bz2 blocks are
+    independent, so they decompress on all cores while CPython's bz2
+    module is single-threaded and caps the whole pipeline at ~10MB/s.
+    """
+    for binary in ('lbzip2', 'pbzip2'):
+        if shutil.which(binary):
+            logger.info(f"Decompressing with {binary}")
+            proc = subprocess.Popen([binary, '-dc', input_path],
+                                    stdout=subprocess.PIPE, bufsize=1 << 20)
+            return io.TextIOWrapper(proc.stdout, encoding='utf-8', errors='replace')
+    return bz2.open(input_path, 'rt', encoding='utf-8', errors='replace')
+
+def read_csv_header(input_path):
+    """Read just the column names from the (compressed) CSV"""
+    with bz2.open(input_path, 'rt', encoding='utf-8', errors='replace') as f:
+        return next(csv.reader(f))
+
+def filter_into_database(input_path, database_url):
+    """
+    Stream the compressed CSV straight into Postgres and filter server-side.
+
+    COPY loads the decompressed stream into an UNLOGGED staging table, then
+    one INSERT ... SELECT joined on search_opinioncluster keeps only
+    opinions whose cluster exists. No client-side set lookup, and no
+    intermediate filtered CSV on disk to re-import afterwards.
+    """
+    logger.info(f"Reading compressed file: {input_path}")
+    logger.info("Filtering inside Postgres via staging table...")
+
+    conn = psycopg2.connect(database_url)
+    cursor = conn.cursor()
+
+    try:
+        header = read_csv_header(input_path)
+        columns = ', '.join(f'"{name}" TEXT' for name in header)
+        cursor.execute("DROP TABLE IF EXISTS staging_opinions")
+        cursor.execute(f"CREATE UNLOGGED TABLE staging_opinions ({columns})")
+        conn.commit()
+
+        with open_decompressed(input_path) as stream:
+            cursor.copy_expert(
+                "COPY staging_opinions FROM STDIN WITH (FORMAT csv, HEADER true)",
+                stream
+            )
+        conn.commit()
+
+        cursor.execute("SELECT COUNT(*) FROM staging_opinions")
+        total_count = cursor.fetchone()[0]
+        logger.info(f"Staged {total_count:,} rows, inserting matching opinions...")
+
+        cursor.execute("""
+            INSERT INTO search_opinion
+            (id, date_created, date_modified, cluster_id, plain_text, html,
+             html_with_citations, type, sha1, download_url, local_path,
+             extracted_by_ocr, word_count, char_count)
+            SELECT NULLIF(NULLIF(s.id, ''), '\\N')::bigint,
+                   NULLIF(NULLIF(s.date_created, ''), '\\N')::timestamptz,
+                   NULLIF(NULLIF(s.date_modified, ''), '\\N')::timestamptz,
+                   NULLIF(NULLIF(s.cluster_id, ''), '\\N')::bigint,
+                   NULLIF(s.plain_text, '\\N'),
+                   NULLIF(s.html, '\\N'),
+                   NULLIF(s.html_with_citations, '\\N'),
+                   NULLIF(NULLIF(s.type, ''), '\\N'),
+                   NULLIF(NULLIF(s.sha1, ''), '\\N'),
+                   NULLIF(NULLIF(s.download_url, ''), '\\N'),
+                   NULLIF(NULLIF(s.local_path, ''), '\\N'),
+                   LOWER(s.extracted_by_ocr) IN ('true', 't', '1', 'yes'),
+                   NULLIF(NULLIF(s.word_count, ''), '\\N')::int,
+                   NULLIF(NULLIF(s.char_count, ''), '\\N')::int
+            FROM staging_opinions s
+            JOIN search_opinioncluster c
+              ON NULLIF(NULLIF(s.cluster_id, ''), '\\N')::bigint = c.id
+            ON CONFLICT (id) DO NOTHING
+        """)
+        kept_count = cursor.rowcount
+        conn.commit()
+
+        cursor.execute("DROP TABLE staging_opinions")
+        conn.commit()
+
+        logger.info("=" * 60)
+        logger.info(f"✅ Filtering complete!")
+        logger.info(f"Total rows staged: {total_count:,}")
+        logger.info(f"Opinions inserted: {kept_count:,}")
+        logger.info("=" * 60)
+
+        return kept_count
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+def filter_opinions_arrow(input_path, output_path, valid_clusters):
+    """Filter opinions with PyArrow's streaming CSV reader (vectorized)"""
+    logger.info(f"Reading compressed file: {input_path}")
+    logger.info(f"Writing filtered opinions to: {output_path}")
+
+    input_size = Path(input_path).stat().st_size / (1024**3)
+    logger.info(f"Compressed file size: {input_size:.2f} GB")
+    logger.info("Streaming decompression and filtering (pyarrow engine)...")
+
+    # Keep every column as string so rows round-trip unchanged
+    column_names = read_csv_header(input_path)
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in column_names},
+        strings_can_be_null=False,
+    )
+    read_options = pacsv.ReadOptions(block_size=1 << 24)
+    value_set = pa.array(list(valid_clusters), type=pa.string())
+
+    kept_count = 0
+    total_count = 0
+
+    stream = pa.CompressedInputStream(pa.OSFile(input_path, 'rb'), 'bz2')
+    with pacsv.open_csv(stream, read_options=read_options,
+                        convert_options=convert_options) as reader:
+        with pacsv.CSVWriter(output_path, reader.schema) as writer:
+            for batch in reader:
+                total_count += batch.num_rows
+                mask = pc.is_in(batch.column('cluster_id'), value_set=value_set)
+                kept = batch.filter(mask)
+                if kept.num_rows:
+                    writer.write_batch(kept)
+                    kept_count += kept.num_rows
+
+                logger.info(
+                    f"Processed {total_count:,} rows | "
+                    f"Kept: {kept_count:,} ({kept_count/total_count*100:.1f}%)"
+                )
+
+    output_size = Path(output_path).stat().st_size / (1024**3)
+
+    logger.info("=" * 60)
+    logger.info(f"✅ Filtering complete!")
+    logger.info(f"Total rows processed: {total_count:,}")
+    logger.info(f"Opinions kept: {kept_count:,}")
+    logger.info(f"Opinions skipped: {total_count - kept_count:,}")
+    logger.info(f"Keep rate: {kept_count/total_count*100:.2f}%")
+    logger.info(f"Compressed input size: {input_size:.2f} GB")
+    logger.info(f"Filtered output size: {output_size:.2f} GB")
+    logger.info("=" * 60)
+
+    return kept_count
+
+ROW_BATCH_SIZE = 10000  # rows per batch handed from reader to filter thread
+
+def _read_row_batches(reader, out_queue):
+    """
+    Producer: decompress + parse rows into batches on a separate thread so
+    the filter/write stage overlaps with decompression (which releases the
+    GIL). Terminates the queue with the exception or None.
+    """
+    batch = []
+    try:
+        for row in reader:
+            batch.append(row)
+            if len(batch) >= ROW_BATCH_SIZE:
+                out_queue.put(batch)
+                batch = []
+        if batch:
+            out_queue.put(batch)
+        out_queue.put(None)
+    except Exception as e:
+        out_queue.put(e)
+
 def filter_opinions_streaming(input_path, output_path, valid_clusters):
     """Filter opinions CSV directly from compressed file"""
+    prefilter = build_cluster_prefilter(valid_clusters)
+    if prefilter is not None:
+        logger.info("Using Bloom prefilter for cluster membership")
     logger.info(f"Reading compressed file: {input_path}")
     logger.info(f"Writing filtered opinions to: {output_path}")
 
@@ -53,26 +271,57 @@ def filter_opinions_streaming(input_path, output_path, valid_clusters):
     skipped_count = 0
     total_count = 0
 
-    # Open compressed file and decompress on-the-fly
-    with bz2.open(input_path, 'rt', encoding='utf-8', errors='replace') as infile:
-        with open(output_path, 'w', encoding='utf-8', newline='') as outfile:
-            reader = csv.DictReader(infile)
-            writer = csv.DictWriter(outfile, fieldnames=reader.fieldnames)
-            writer.writeheader()
-
-            for row in reader:
-                total_count += 1
-
-                # Check if cluster_id exists in our database
-                cluster_id = row.get('cluster_id', '')
-                if cluster_id and cluster_id in valid_clusters:
-                    writer.writerow(row)
-                    kept_count += 1
-                else:
-                    skipped_count += 1
-
-                # Progress update every 100K rows
-                if total_count % 100000 == 0:
+    # Open compressed file and decompress on-the-fly. Positional csv.reader
+    # keeps rows as lists - no per-row dict construction just to look at
+    # one column (DictReader builds an N-key dict for every row).
+    # 1 MiB output buffer so kept rows flush in large sequential writes
+    # instead of one syscall-sized write per line
+    with open_decompressed(input_path) as infile:
+        with open(output_path, 'w', encoding='utf-8', newline='',
+                  buffering=1 << 20) as outfile:
+            reader = csv.reader(infile)
+            writer = csv.writer(outfile)
+
+            header = next(reader)
+            cluster_idx = header.index('cluster_id')
+            writer.writerow(header)
+
+            # Reader thread feeds row batches through a bounded queue so
+            # decompression/parsing overlaps with filtering/writing
+            row_queue = queue.Queue(maxsize=4)
+            producer = threading.Thread(target=_read_row_batches,
+                                        args=(reader, row_queue), daemon=True)
+            producer.start()
+
+            while True:
+                batch = row_queue.get()
+                if batch is None:
+                    break
+                if isinstance(batch, Exception):
+                    raise batch
+
+                kept_rows = []
+                for row in batch:
+                    total_count += 1
+
+                    # Check if cluster_id exists in our database; the Bloom
+                    # filter rejects most misses before the big set probe
+                    cluster_id = row[cluster_idx] if len(row) > cluster_idx else ''
+                    if cluster_id and \
+                            (prefilter is None or cluster_id in prefilter) and \
+                            cluster_id in valid_clusters:
+                        kept_rows.append(row)
+                        kept_count += 1
+                    else:
+                        skipped_count += 1
+
+                # One writerows call per batch - the quoting loop runs in
+                # C without surfacing per row
+                if kept_rows:
+                    writer.writerows(kept_rows)
+
+                # Progress update per batch
+                if total_count % 100000 < ROW_BATCH_SIZE:
                     output_size = Path(output_path).stat().st_size / (1024**3) if os.path.exists(output_path) else 0
                     logger.info(
                         f"Processed {total_count:,} rows | "
@@ -81,6 +330,8 @@ def filter_opinions_streaming(input_path, output_path, valid_clusters):
                         f"Output size: {output_size:.2f} GB"
                     )
 
+            producer.join()
+
     output_size = Path(output_path).stat().st_size / (1024**3)
 
     logger.info("=" * 60)
@@ -100,8 +351,12 @@ def main():
 
     parser = argparse.ArgumentParser(description='Filter opinions CSV from compressed file')
     parser.add_argument('--input', required=True, help='Input compressed CSV file (.bz2)')
-    parser.add_argument('--output', required=True, help='Output filtered CSV file')
+    parser.add_argument('--output', help='Output filtered CSV file')
     parser.add_argument('--database-url', required=True, help='Database URL')
+    parser.add_argument('--engine', choices=['auto', 'arrow', 'python'], default='auto',
+                        help='CSV engine: pyarrow (vectorized) or the pure-Python loop')
+    parser.add_argument('--to-database', action='store_true',
+                        help='Skip the filtered CSV: COPY into a staging table and filter server-side')
 
     args = parser.parse_args()
 
@@ -110,8 +365,12 @@ def main():
         logger.error(f"Input file not found: {args.input}")
         sys.exit(1)
 
+    if not args.to_database and not args.output:
+        logger.error("Either --output or --to-database is required")
+        sys.exit(1)
+
     # Check output file doesn't already exist
-    if os.path.exists(args.output):
+    if args.output and os.path.exists(args.output):
         response = input(f"Output file {args.output} already exists. Overwrite? (y/N): ")
         if response.lower() != 'y':
             logger.info("Aborted")
@@ -119,6 +378,14 @@ def main():
         os.remove(args.output)
 
     try:
+        if args.to_database:
+            # Single pass: COPY into staging and join server-side
+            kept_count = filter_into_database(args.input, args.database_url)
+            if kept_count == 0:
+                logger.warning("⚠️  No matching opinions found!")
+                logger.warning("This might indicate a mismatch between cluster IDs in the database and CSV")
+            return
+
         # Get valid cluster IDs from database
         valid_clusters = get_valid_cluster_ids(args.database_url)
 
@@ -127,7 +394,15 @@ def main():
             sys.exit(1)
 
         # Filter opinions with streaming decompression
-        kept_count = filter_opinions_streaming(args.input, args.output, valid_clusters)
+        use_arrow = args.engine == 'arrow' or (args.engine == 'auto' and pa is not None)
+        if use_arrow and pa is None:
+            logger.error("pyarrow is not installed (pip install pyarrow)")
+            sys.exit(1)
+
+        if use_arrow:
+            kept_count = filter_opinions_arrow(args.input, args.output, valid_clusters)
+        else:
+            kept_count = filter_opinions_streaming(args.input, args.output, valid_clusters)
 
         if kept_count == 0:
             logger.warning("⚠️  No matching opinions found!")
@@ -84,16 +84,48 @@ def parse_csv_line(line):
         'group_id': group_id
     }
 
+class OpinionIdBitmap:
+    """
+    One bit per opinion id instead of a set entry.
+
+    Ids are dense, so a bytearray bitmap answers membership exactly in
+    max_id / 8 bytes - megabytes where the set needed gigabytes - and
+    the two probes per row stop thrashing the cache.
+    """
+
+    def __init__(self, max_id):
+        self._bits = bytearray((max_id >> 3) + 1)
+        self._max_id = max_id
+        self.count = 0
+
+    def add(self, oid):
+        self._bits[oid >> 3] |= 1 << (oid & 7)
+        self.count += 1
+
+    def __contains__(self, oid):
+        return (0 <= oid <= self._max_id
+                and self._bits[oid >> 3] >> (oid & 7) & 1 == 1)
+
 def get_valid_opinion_ids(database_url):
-    """Get set of all opinion IDs in our database"""
+    """Build a bitmap of all opinion IDs in our database"""
     logger.info("Loading valid opinion IDs from database...")
     conn = psycopg2.connect(database_url)
     cursor = conn.cursor()
+    cursor.execute("SELECT max(id) FROM search_opinion")
+    max_id = cursor.fetchone()[0] or 0
+    cursor.close()
+    opinion_ids = OpinionIdBitmap(max_id)
+    # A named cursor is server-side: ids stream over in itersize chunks
+    # and go straight into the bitmap, instead of the whole result set
+    # materializing client-side as a list of tuples first
+    cursor = conn.cursor(name='opinion_id_stream')
+    cursor.itersize = 100000
     cursor.execute("SELECT id FROM search_opinion")
-    opinion_ids = set(row[0] for row in cursor.fetchall())
+    for (oid,) in cursor:
+        opinion_ids.add(oid)
     cursor.close()
     conn.close()
-    logger.info(f"Found {len(opinion_ids):,} opinion IDs in database")
+    logger.info(f"Found {opinion_ids.count:,} opinion IDs in database")
     return opinion_ids
 
 def import_parentheticals_batch(conn, batch):
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Content-addressed on-disk store for opinion bodies, compressed with zstd.
+
+Large opinion HTML (html_with_citations can exceed 1MB) otherwise lands in
+Postgres TOAST, where pglz compresses poorly and bloats the heap. Storing
+bodies here keyed by their sha1 keeps database rows small - only the sha1
+pointer stays in search_opinion - while zstd level 3 compresses ~3x better
+than pglz and decompresses faster.
+
+Files shard by the first two hex chars of the sha1 (256 directories) so no
+single directory accumulates millions of entries:
+
+    <root>/ab/abcdef1234....zst
+
+Usage:
+    from opinion_body_store import OpinionBodyStore
+    store = OpinionBodyStore('/data/opinion-bodies')
+    store.put(sha1, text)
+    text = store.get(sha1)
+"""
+import os
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Optional fast compression (pip install zstandard)
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class OpinionBodyStore:
+    """Filesystem blob store keyed by sha1, sharded by hash prefix"""
+
+    def __init__(self, root: str, level: int = 3):
+        if zstandard is None:
+            raise RuntimeError(
+                "zstandard is required for the opinion body store "
+                "(pip install zstandard)"
+            )
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._compressor = zstandard.ZstdCompressor(level=level)
+        self._decompressor = zstandard.ZstdDecompressor()
+
+    def path_for(self, sha1: str) -> Path:
+        return self.root / sha1[:2] / f"{sha1}.zst"
+
+    def put(self, sha1: str, text: str) -> Path:
+        """Compress and write a body; returns the path. Idempotent."""
+        path = self.path_for(sha1)
+        if path.exists():
+            return path
+        path.parent.mkdir(exist_ok=True)
+        # Write via a temp name then rename so readers never see a
+        # partially-written blob
+        tmp = path.with_suffix('.tmp')
+        tmp.write_bytes(self._compressor.compress(text.encode('utf-8')))
+        os.replace(tmp, path)
+        return path
+
+    def get(self, sha1: str) -> str:
+        """Read and decompress a body; returns None when absent"""
+        path = self.path_for(sha1)
+        try:
+            compressed = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        return self._decompressor.decompress(compressed).decode('utf-8')
+
+    def __contains__(self, sha1: str) -> bool:
+        return self.path_for(sha1).exists()